@@ -4,13 +4,36 @@ It is a dashboard that shows you the effects of tuning different numbers.
 The exact toolset presented will depend on where you're currently at.
 The UI will evolve/unlock new tools as you progress through different stages.
 """
+import os
+import sys
 import tkinter as tk
-from widgets import BudgetWidget
+
+
+STAGE_WIDGETS = (  # widget (class name in widgets.py) unlocked at each stage
+    'BudgetWidget',
+    'DebtPayoffWidget',
+    'FireWidget'
+)
 
 
 if __name__ == '__main__':
+    # current personal finance stage
+    stage_text = os.environ.get('STAGE', '0')
+    try:
+        STAGE = int(stage_text)
+    except ValueError:
+        STAGE = None
+    if STAGE is None or not 0 <= STAGE < len(STAGE_WIDGETS):
+        sys.exit(
+            f'STAGE must be an integer from 0 to {len(STAGE_WIDGETS) - 1}, '
+            f'got {stage_text!r}'
+        )
+
+    import widgets  # deferred b/c it pulls in matplotlib
+
     # create main dashboard window
     ROOT = tk.Tk()
-    ROOT.title('Stage 0')
-    BudgetWidget(ROOT).pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
+    ROOT.title(f'Stage {STAGE}')
+    widget = getattr(widgets, STAGE_WIDGETS[STAGE])
+    widget(ROOT).pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
     ROOT.mainloop()
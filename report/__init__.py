@@ -1,44 +1,190 @@
 """Code for easily-creating HTML reports w/a pre-defined figure style. """
-import base64
+import hashlib
 import io
+import os
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List
-from jinja2 import Environment, FileSystemLoader
+from typing import Dict, List, Optional, Tuple
+from jinja2 import (
+    Environment,
+    FileSystemBytecodeCache,
+    FileSystemLoader,
+    Template
+)
 from matplotlib import pyplot as plt
+from PIL import Image
+try:
+    from pybase64 import b64encode  # SIMD codec, same API as stdlib
+except ImportError:
+    from base64 import b64encode
 
 
 MY_DIR = Path(__file__).parent
+CACHE_DIR = MY_DIR / '.jinja_cache'
 
 
-def fig_to_base64(fig: plt.Figure) -> str:
+def _bytecode_cache() -> Optional[FileSystemBytecodeCache]:
+    """Pick where compiled templates are cached across processes.
+       Package dir if writable, else jinja's temp dir, else nowhere.
+
+    Returns:
+        Optional[FileSystemBytecodeCache]: bytecode cache (None if none)
+    """
+    try:
+        CACHE_DIR.mkdir(exist_ok=True)
+        if os.access(CACHE_DIR, os.W_OK):
+            return FileSystemBytecodeCache(directory=str(CACHE_DIR))
+    except OSError:
+        pass  # e.g. installed copy or read-only checkout
+    try:
+        return FileSystemBytecodeCache()
+    except (OSError, RuntimeError):
+        return None  # no safe temp dir either
+
+
+@lru_cache(maxsize=None)
+def _env() -> Environment:
+    """Environment: template environment (built on first use) """
+    return Environment(
+        loader=FileSystemLoader(MY_DIR),
+        auto_reload=False,
+        optimized=True,
+        bytecode_cache=_bytecode_cache()
+    )
+
+
+@lru_cache(maxsize=None)
+def get_template(name: str = 'template.html') -> Template:
+    """Load and compile a report template (once per process).
+
+    Args:
+        name (str): template file name relative to this package
+
+    Returns:
+        Template: compiled template
+    """
+    return _env().get_template(name)
+
+
+@lru_cache(maxsize=None)
+def _executor() -> ThreadPoolExecutor:
+    """ThreadPoolExecutor: figure encoding workers (started on first use) """
+    return ThreadPoolExecutor(thread_name_prefix='report')
+
+
+def render_figure(
+    fig: plt.Figure,
+    dpi: int = 90
+) -> Tuple[bytes, Tuple[int, int]]:
+    """Render a figure's current state to raw RGBA pixels.
+       Goes through savefig, so savefig.* rcParams (e.g. a tight bbox)
+       apply and the size is that of the actual render.
+
+    Args:
+        fig (plt.Figure): figure to render
+        dpi (int): resolution to render figure at
+
+    Returns:
+        bytes, Tuple[int, int]: RGBA pixels (row-major), (width, height)
+    """
+    buffer = io.BytesIO()
+    fig.savefig(
+        buffer,
+        format='png',
+        dpi=dpi,
+        pil_kwargs={'compress_level': 0}  # decoded right away, skip zlib
+    )
+    with Image.open(buffer) as image:
+        rgba, size = image.tobytes(), image.size
+    assert len(rgba) == 4 * size[0] * size[1], 'expected RGBA pixels'
+    return rgba, size
+
+
+def rgba_to_base64(
+    rgba: bytes,
+    size: Tuple[int, int],
+    dpi: int = 90,
+    quality: int = 80
+) -> str:
+    """Convert rendered RGBA pixels to a Base64-encoded JPEG.
+
+    Args:
+        rgba (bytes): RGBA pixels (row-major)
+        size (Tuple[int, int]): image (width, height) in pixels
+        dpi (int): resolution the pixels were rendered at
+        quality (int): JPEG quality (1-95), lower is smaller/faster
+
+    Returns:
+        str: HTML-embeddable Base64 JPEG
+    """
+    image = Image.frombuffer('RGBA', size, rgba, 'raw', 'RGBA', 0, 1)
+    flat = Image.new('RGB', size, 'white')  # blend alpha like savefig
+    flat.paste(image, mask=image)
+    buffer = io.BytesIO()
+    flat.save(
+        buffer,
+        format='jpeg',
+        dpi=(dpi, dpi),
+        quality=quality,
+        optimize=False,
+        progressive=False
+    )
+    # encode straight from the buffer's memory (no copy), output is ASCII
+    return b64encode(buffer.getbuffer()).decode('ascii')
+
+
+def fig_to_base64(fig: plt.Figure, dpi: int = 90, quality: int = 80) -> str:
     """Convert a figure to a Base64-encoded JPEG.
 
     Args:
         fig (plt.Figure): figure to convert
+        dpi (int): resolution to render figure at
+        quality (int): JPEG quality (1-95), lower is smaller/faster
 
     Returns:
         str: HTML-embeddable Base64 JPEG
     """
-    buffer = io.BytesIO()
-    fig.savefig(buffer, format='jpeg')
-    buffer.seek(0)
-    return base64.b64encode(buffer.read()).decode('utf-8')
+    return rgba_to_base64(*render_figure(fig, dpi), dpi, quality)
+
+
+# identifies a figure snapshot: RGBA digest, width, height, dpi, quality
+SnapshotKey = Tuple[bytes, int, int, int, int]
 
 
 class Report:
     """Utility class to build HTML reports. """
     def __init__(self) -> None:
-        environment = Environment(loader=FileSystemLoader(MY_DIR))
-        self._template = environment.get_template('template.html')
-        self._images: List[str] = []
+        self._figs: List[SnapshotKey] = []  # added snapshots in order
+
+        # snapshot -> its (possibly still running) Base64 JPEG encoding,
+        # identical snapshots (e.g. re-added unchanged figures) share one
+        self._images: Dict[SnapshotKey, Future] = {}
 
-    def add_figure(self, fig: plt.Figure) -> None:
-        """Convert and add a new figure to the report.
+    def add_figure(
+        self,
+        fig: plt.Figure,
+        dpi: int = 90,
+        quality: int = 80
+    ) -> None:
+        """Add a new figure to the report.
+           The figure is rendered now (later changes to it don't show up in
+           the report) and JPEG-encoded in the background.
 
         Args:
             fig (plt.Figure): figure to add
+            dpi (int): resolution to render figure at
+            quality (int): JPEG quality (1-95), lower is smaller/faster
         """
-        self._images.append(fig_to_base64(fig))
+        rgba, size = render_figure(fig, dpi)
+        digest = hashlib.blake2b(rgba, digest_size=16).digest()
+        key = (digest, *size, dpi, quality)
+        if key not in self._images:
+            # PIL drops the GIL while encoding, pixels are freed once done
+            self._images[key] = _executor().submit(
+                rgba_to_base64, rgba, size, dpi, quality
+            )
+        self._figs.append(key)
 
     def write(self, report_path: str = './report.html') -> None:
         """Compile report and write to disk.
@@ -46,6 +192,12 @@ class Report:
         Args:
             report_path (str): where to write report
         """
-        report = self._template.render(images=self._images)
-        with open(report_path, mode='w', encoding='utf-8') as report_file:
-            report_file.write(report)
+        images = [self._images[key].result() for key in self._figs]
+        with open(
+            report_path,
+            mode='w',
+            encoding='utf-8',
+            buffering=1 << 20
+        ) as report_file:
+            # stream chunks to disk, never hold the whole document
+            get_template().stream(images=images).dump(report_file)
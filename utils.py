@@ -1,19 +1,36 @@
 """Widget support code, mostly backend data structures and math. """
-from copy import deepcopy
-from typing import Dict, Iterable, List, Tuple, Union
+import math
+from contextlib import contextmanager
+from copy import copy
+from functools import lru_cache
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
+from matplotlib.axes import Axes
+from matplotlib.figure import Figure
 from matplotlib.lines import Line2D
-from matplotlib import pyplot as plt
+import numpy as np
 
 
 Numeric = Union[int, float]
+DONUT_PALETTE = ('#f99', '#6cf', '#ff9', '#9f9', '#fc9', '#ccf')
 
 
 class LineGraph:
     """Multi-line graph with CRUD operations. """
     def __init__(self, max_lines: int = 5):
         self.max_lines = max_lines
-        self.fig, self.axes = plt.subplots()
+        self.fig = Figure()  # not pyplot-managed, embedder attaches a canvas
+        self.axes = self.fig.add_subplot()
         self.lines = []  # lines on graph
+        self._line_idx: Dict[Line2D, int] = {}  # line -> index in self.lines
+        self._xcache = np.arange(0)  # default x data, see _xdata()
+        self._suspend_draw = False  # True while inside batch()
+
+        # blitting: selected lines are animated (left out of full draws),
+        # so the background captured after each draw can be reused for them
+        self._background = None
+        self._background_canvas = None
+        self._background_renderer = None
+        self.fig.canvas.mpl_connect('draw_event', self._on_draw)
 
     def __iter__(self) -> Iterable[Tuple[int, Line2D]]:
         """Loop over graph lines.
@@ -24,6 +41,17 @@ class LineGraph:
         for i_line, line in enumerate(self.lines):
             yield i_line, line
 
+    def index(self, artist) -> Optional[int]:
+        """Look up which line an artist is (e.g. from a pick event).
+
+        Args:
+            artist (Artist): artist to look up
+
+        Returns:
+            Optional[int]: index of line (None if artist is not a graph line)
+        """
+        return self._line_idx.get(artist)
+
     def plot(self, *args, metadata: dict = None, **kwargs) -> bool:
         """Plot a new line.
 
@@ -37,37 +65,46 @@ class LineGraph:
         if len(self.lines) == self.max_lines:
             return False
         self.lines.append(self.axes.plot(*args, **kwargs)[0])
-        self.unselect(self.num_lines - 1)  # force styling
+        self._line_idx[self.lines[-1]] = len(self.lines) - 1
+        self._style(self.lines[-1], selected=False)  # force styling
         if metadata is not None:
-            self.lines[-1].metadata = deepcopy(metadata)
-        self.fig.canvas.draw()
+            self.lines[-1].metadata = copy(metadata)
+        self._draw()
         return True
 
     def update(
         self,
         which: int,
-        xdata: Iterable[Numeric],
         ydata: Iterable[Numeric],
-        metadata: dict
+        metadata: dict,
+        xdata: Iterable[Numeric] = None
     ) -> bool:
         """Update a line in the graph.
 
         Args:
             which (int): index of line to update
-            xdata (Iterable[Numeric]): new line x data
             ydata (Iterable[Numeric]): new line y data
             metadata (dict): user-defined metadata
+            xdata (Iterable[Numeric]): new line x data (default 0, 1, ...)
 
         Returns:
             bool: whether a line was updated
         """
         if not 0 <= which < self.num_lines:
             return False
-        self.lines[which].set_data(xdata, ydata)
-        self.lines[which].metadata = deepcopy(metadata)
-        self.axes.relim()
-        self.axes.autoscale()
-        self.fig.canvas.draw()
+        line = self.lines[which]
+        if xdata is None:
+            xdata = self._xdata(len(ydata))
+        line.set_data(xdata, ydata)
+        line.metadata = copy(metadata)
+        limits = self.axes.viewLim.bounds
+        if self.axes.get_autoscale_on():
+            self.axes.relim()  # walks every line, skipped w/fixed limits
+            self.axes.autoscale()
+        if line.get_animated() and limits == self.axes.viewLim.bounds:
+            self._blit()  # only the line moved, axes/ticks are unchanged
+        else:
+            self._draw()
         return True
 
     def remove(self, which: int) -> bool:
@@ -81,8 +118,12 @@ class LineGraph:
         """
         if not 0 <= which < self.num_lines:
             return False
-        self.lines.pop(which).remove()
-        self.fig.canvas.draw()
+        line = self.lines.pop(which)
+        line.remove()
+        del self._line_idx[line]
+        for i_line in range(which, len(self.lines)):  # later lines shift
+            self._line_idx[self.lines[i_line]] = i_line
+        self._draw()
         return True
 
     def select(self, which: int) -> bool:
@@ -96,10 +137,8 @@ class LineGraph:
         """
         if not 0 <= which < self.num_lines:
             return False
-        self.lines[which].set_marker('.')
-        self.lines[which].set_linestyle('--')
-        self.lines[which].set_color('r')
-        self.fig.canvas.draw()
+        self._style(self.lines[which], selected=True)
+        self._draw()
         return True
 
     def unselect(self, which: int) -> bool:
@@ -113,12 +152,84 @@ class LineGraph:
         """
         if not 0 <= which < self.num_lines:
             return False
-        self.lines[which].set_marker('')
-        self.lines[which].set_linestyle('-')
-        self.lines[which].set_color('k')
-        self.fig.canvas.draw()
+        self._style(self.lines[which], selected=False)
+        self._draw()
         return True
 
+    @contextmanager
+    def batch(self) -> Iterator[None]:
+        """Group several mutations so the graph is redrawn only once. """
+        suspended, self._suspend_draw = self._suspend_draw, True
+        try:
+            yield
+        finally:
+            self._suspend_draw = suspended
+            self._draw()
+
+    def _xdata(self, num: int) -> np.ndarray:
+        """Get x data 0, 1, ..., num - 1 w/o allocating on every update.
+
+        Args:
+            num (int): number of points
+
+        Returns:
+            np.ndarray: view into a shared, geometrically-grown buffer
+        """
+        if num > len(self._xcache):
+            self._xcache = np.arange(max(num, 2 * len(self._xcache)))
+            self._xcache.flags.writeable = False
+        return self._xcache[:num]
+
+    @staticmethod
+    def _style(line: Line2D, selected: bool) -> None:
+        """Style a line as (un)selected without redrawing.
+
+        Args:
+            line (Line2D): line to style
+            selected (bool): whether the line is selected
+        """
+        if selected:
+            # selected lines are likely to be edited, animate to blit them
+            line.set(marker='.', linestyle='--', color='r', animated=True)
+        else:
+            line.set(marker='', linestyle='-', color='k', animated=False)
+
+    def _draw(self) -> None:
+        """Schedule a redraw on the next idle cycle (unless batching). """
+        if not self._suspend_draw:
+            self._background = None  # recaptured once the draw happens
+            self.fig.canvas.draw_idle()
+
+    def _blit(self) -> None:
+        """Redraw only the animated lines over the cached background. """
+        if self._suspend_draw:
+            return  # batch() ends with a full redraw anyway
+        canvas = self.fig.canvas
+        if (
+            self._background is None
+            or canvas is not self._background_canvas
+            or canvas.get_renderer() is not self._background_renderer
+        ):
+            self._draw()  # background is missing or from another size/dpi
+            return
+        canvas.restore_region(self._background)
+        self._draw_animated(self._background_renderer)
+        canvas.blit(self.axes.bbox)
+
+    def _draw_animated(self, renderer) -> None:
+        """Render animated (i.e. selected) lines. """
+        for line in self.lines:
+            if line.get_animated():
+                line.draw(renderer)
+
+    def _on_draw(self, event) -> None:
+        """Cache the line-free background after a full draw. """
+        if event.canvas.supports_blit:
+            self._background = event.canvas.copy_from_bbox(self.axes.bbox)
+            self._background_canvas = event.canvas
+            self._background_renderer = event.renderer
+        self._draw_animated(event.renderer)  # full draws skip animated lines
+
     @property
     def num_lines(self) -> int:
         """int: the number of lines on the graph """
@@ -128,7 +239,8 @@ class LineGraph:
 class DonutGraph:
     """Donut graph w/utility functions. """
     def __init__(self):
-        self.fig, self.axes = plt.subplots(figsize=(6, 6))
+        self.fig = Figure(figsize=(6, 6))  # not pyplot-managed
+        self.axes = self.fig.add_subplot()
         self.wedges = None
         self.labels = None
 
@@ -146,7 +258,29 @@ class DonutGraph:
         self.axes.cla()
         self.labels = list(data.keys())
         _, _, self.wedges = plot_donut(data, self.axes, colors)
-        self.fig.canvas.draw()
+        self.fig.canvas.draw_idle()
+
+    def recolor(self, colors: Dict[str, str] = None) -> None:
+        """Recolor the plotted wedges in place (no replot).
+
+        Args:
+            colors (Dict[str, str]): wedge color map ... label -> color
+        """
+        if self.wedges is None:
+            return
+        for wedge, color in zip(
+            self.wedges,
+            _wedge_colors(self.labels, colors)
+        ):
+            wedge.set_facecolor(color)
+        self.fig.canvas.draw_idle()
+
+    def clear(self) -> None:
+        """Remove the donut. """
+        self.axes.cla()
+        self.wedges = None
+        self.labels = None
+        self.fig.canvas.draw_idle()
 
     def get_wedge_key(self, wedge) -> str:
         """Get the label corresponding to a wedge. """
@@ -156,9 +290,9 @@ class DonutGraph:
 
 def plot_donut(
     data: Dict[str, float],
-    axes: plt.Axes = None,
+    axes: Axes = None,
     colors: Dict[str, str] = None
-) -> Tuple[plt.Figure, plt.Axes]:
+) -> Tuple[Figure, Axes]:
     """Plot a donut chart (pie chart but cooler).
 
     Args:
@@ -166,23 +300,22 @@ def plot_donut(
         colors (Dict[str, str]): wedge color map ... label -> color
 
     Returns:
-        Tuple[plt.Figure, plt.Axes]: plot handles
+        Tuple[Figure, Axes]: plot handles
     """
-    if colors is None:
-        colors = ['#f99', '#6cf', '#ff9', '#9f9', '#fc9',  '#ccf']
-        wedge_colors = [colors[idx % len(colors)] for idx in range(len(data))]
-    else:
-        wedge_colors = map(lambda k: colors[k], data)
+    labels = list(data.keys())
+    sizes = list(data.values())
+    wedge_colors = _wedge_colors(labels, colors)
 
     fig = None
     if axes is None:
+        from matplotlib import pyplot as plt  # only standalone plots need it
         fig, axes = plt.subplots()
     wedges, *_ = axes.pie(
-        data.values(),
+        sizes,
         autopct='%.1f%%',
         colors=wedge_colors,
         counterclock=False,
-        labels=data.keys(),
+        labels=labels,
         labeldistance=1.1,
         pctdistance=0.85,
         startangle=180,
@@ -194,16 +327,130 @@ def plot_donut(
     )
     for wedge in wedges:
         wedge.set_picker(True)
-    total = sum(data.values())
+    total = sum(sizes)
     axes.text(0, 0, f'{total}', ha='center', va='center', fontsize=16)
     return fig, axes, wedges
 
 
+def _wedge_colors(
+    labels: List[str],
+    colors: Dict[str, str] = None
+) -> List[str]:
+    """Pick donut wedge colors.
+
+    Args:
+        labels (List[str]): wedge labels in plotting order
+        colors (Dict[str, str]): wedge color map (default palette if None)
+
+    Returns:
+        List[str]: wedge colors in plotting order
+    """
+    if colors is None:
+        return [
+            DONUT_PALETTE[idx % len(DONUT_PALETTE)]
+            for idx in range(len(labels))
+        ]
+    return [colors[label] for label in labels]
+
+
+def _payoff_schedule(
+    balance: float,
+    payment: float,
+    rate: float
+) -> np.ndarray:
+    """Running balance of an amortized debt (numeric kernel, no checks).
+
+    Args:
+        balance (float): initial balance amount (> 0)
+        payment (float): monthly payment amount (> monthly interest)
+        rate (float): monthly interest rate as a fraction
+
+    Returns:
+        np.ndarray: running monthly balance, last entry is the payoff month
+    """
+    # closed-form amortization: B_k = (B - P/r)(1 + r)^k + P/r
+    # (built in place in one preallocated buffer, no temporaries)
+    if rate == 0:
+        months = math.ceil(balance / payment)
+        running_balance = np.arange(months + 1, dtype=np.float64)
+        running_balance *= -payment
+        running_balance += balance
+    else:
+        offset = payment / rate
+        months = math.ceil(
+            math.log(payment / (payment - rate * balance)) / math.log1p(rate)
+        )
+        # the log carries rounding error, settle exact payoffs (balance hits
+        # 0) by checking the closed form around the estimate, e.g. 100 at 1%
+        # a month paid off w/101 takes exactly 1 month but the ceil gives 2
+        tol = 1e-9 * balance
+        if (balance - offset) * (1 + rate) ** months + offset > tol:
+            months += 1
+        elif months > 1 and (
+            (balance - offset) * (1 + rate) ** (months - 1) + offset <= tol
+        ):
+            months -= 1
+        running_balance = np.arange(months + 1, dtype=np.float64)
+        np.power(1 + rate, running_balance, out=running_balance)
+        running_balance *= balance - offset
+        running_balance += offset
+    running_balance[-1] = 0
+    return running_balance
+
+
+def _growth_schedule(
+    balance: float,
+    deposit: float,
+    growth: float,
+    target: float
+) -> np.ndarray:
+    """Running balance of a growing portfolio (numeric kernel, no checks).
+
+    Args:
+        balance (float): initial portfolio balance (< target)
+        deposit (float): annual deposit into portfolio
+        growth (float): annual portfolio yield as a fraction
+        target (float): balance to grow until
+
+    Returns:
+        np.ndarray: running annual balance, last entry is the first >= target
+    """
+    # closed-form growth: B_k = (B + d/g)(1 + g)^k - d/g
+    # (built in place in one preallocated buffer, no temporaries)
+    if growth == 0:
+        years = math.ceil((target - balance) / deposit)
+        running_balance = np.arange(years + 1, dtype=np.float64)
+        running_balance *= deposit
+        running_balance += balance
+        return running_balance
+    offset = deposit / growth
+    years = math.ceil(
+        math.log((target + offset) / (balance + offset)) / math.log1p(growth)
+    )
+    # the log carries rounding error, settle exact hits of the target by
+    # checking the closed form around the estimate, e.g. 2960 growing 5% w/
+    # 252 deposited lands on 3360 after exactly 1 year but the ceil gives 2
+    tol = 1e-9 * target
+    if (balance + offset) * (1 + growth) ** years - offset < target - tol:
+        years += 1
+    elif years > 1 and (
+        (balance + offset) * (1 + growth) ** (years - 1) - offset
+        >= target - tol
+    ):
+        years -= 1
+    running_balance = np.arange(years + 1, dtype=np.float64)
+    np.power(1 + growth, running_balance, out=running_balance)
+    running_balance *= balance + offset
+    running_balance -= offset
+    return running_balance
+
+
+@lru_cache(maxsize=256)  # entries revisit values while the user types
 def calc_time_until_cleared(
     balance: float = 1000,
     payment: float = 25,
     apr: float = 25
-) -> Tuple[int, List[float]]:
+) -> Tuple[int, np.ndarray]:
     """Calculate how long it takes to payoff a balance.
 
     Args:
@@ -213,26 +460,27 @@ def calc_time_until_cleared(
 
     Returns:
         int, np.ndarray: months until paid off, running monthly balance
+        (memoized, so the array is read-only)
     """
-    interest = apr * balance / 1200
-    if payment <= interest:
+    rate = apr / 1200
+    if payment <= rate * balance:
         raise RuntimeError('interest exceeds payment')
-    running_balance = []
-    while balance > 0:
-        running_balance.append(balance)
-        balance = balance + interest - payment
-        interest = apr * balance / 1200
-    running_balance.append(0)
+    if balance <= 0:
+        running_balance = np.zeros(1)
+    else:
+        running_balance = _payoff_schedule(balance, payment, rate)
+    running_balance.flags.writeable = False  # shared by all cache hits
     return len(running_balance) - 1, running_balance
 
 
+@lru_cache(maxsize=256)
 def calc_time_until_fire(
     income: float = 3000,
     balance: float = 1000,
     deposit: float = 100,
     rate: float = 7,
     safe_rate: float = None
-) -> Tuple[int, List[float]]:
+) -> Tuple[int, np.ndarray]:
     """Calculate how long it takes to build a passive income stream.
 
     Args:
@@ -244,15 +492,16 @@ def calc_time_until_fire(
 
     Returns:
         int, np.ndarray: years until FIRE, running annual balance
+        (memoized, so the array is read-only)
     """
     safe_rate = rate if safe_rate is None else safe_rate
     target = 1200 * income / safe_rate
     if target <= balance:
         raise RuntimeError('already at FIRE')
-    running_balance = []
-    while balance < target:
-        running_balance.append(balance)
-        gain = rate * balance / 100
-        balance = balance + gain + 12 * deposit
-    running_balance.append(balance)
+    if rate * balance / 100 + 12 * deposit <= 0:
+        raise RuntimeError('portfolio never grows')
+    running_balance = _growth_schedule(
+        balance, 12 * deposit, rate / 100, target
+    )
+    running_balance.flags.writeable = False  # shared by all cache hits
     return len(running_balance) - 1, running_balance
@@ -1,14 +1,33 @@
 """Standalone tkinter widgets to insert into dashboard. """
+import re
 import tkinter as tk
 from tkinter import filedialog, ttk
-from typing import Callable, Dict, List
+from typing import Callable, Dict, List, Optional, Tuple
 from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+import numpy as np
 import utils
 
 
+# save-image dialog options
+_FILETYPES = (('JPEG files', '*.jpg;*.jpeg'), ('PNG files', '*.png'))
+_DEFAULT_EXT = '.jpg'
+
+# natural number (no leading zero) or '', Python and Tcl-side validators
+_NATURAL_NUMBER = re.compile(r'(?:[1-9][0-9]*)?').fullmatch
+_VALIDATOR = '::natural_number_valid'
+_VALIDATOR_PROC = (
+    'proc ' + _VALIDATOR + ' {s} {return [regexp {^([1-9][0-9]*)?$} $s]}'
+)
+
+
 class NaturalNumberEntry(ttk.Frame):
     """Label + Entry widget for entering natural numbers. """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(
+        self,
+        *args,
+        debounce_ms: Optional[int] = 150,
+        **kwargs
+    ) -> None:
         super().__init__(*args, **kwargs)
 
         # label prompt for entry
@@ -17,27 +36,31 @@ class NaturalNumberEntry(ttk.Frame):
 
         # entry box and backend entry data variable
         self.entry_var = tk.StringVar()
+        self.tk.eval(_VALIDATOR_PROC)  # (re)defining the proc is cheap
         self.entry = tk.Entry(
             self,
             textvariable=self.entry_var,
             validate='key',
-            validatecommand=(
-                self.register(self.is_valid),
-                '%P'
-            )
+            validatecommand=(_VALIDATOR, '%P')
         )
         self.entry.pack(padx=2, pady=2, side=tk.LEFT)
 
         # setup mechanism to update observers/subscribers
+        # (debounced, observers only hear about the value once typing pauses,
+        # None notifies on every write, for owners that debounce themselves)
         self.disabled = False
+        self.debounce_ms = debounce_ms
         self.entry_var.trace_add('write', self.run_traces)
         self._traces: List[Callable] = []
         self._backup_value = 0
+        self._pending = None  # Tk after() id of the scheduled notification
+        self._value: Optional[int] = None  # parsed entry text, see value
 
     @staticmethod
     def is_valid(proposed: str) -> bool:
         """Check whether text is a natural number (no leading zero).
-           Empty string is also okay.
+           Empty string is also okay. Mirrors the Tcl-side validator, for
+           checking text set from code (typed text is checked in Tcl).
 
         Args:
             proposed (str): text to check
@@ -45,9 +68,7 @@ class NaturalNumberEntry(ttk.Frame):
         Returns:
             bool: whether text is a natural number (no leading zero)
         """
-        if proposed == '':
-            return True
-        return proposed[0] != '0' and proposed.isdigit()
+        return _NATURAL_NUMBER(proposed) is not None
 
     def set_text(self, text: str) -> None:
         """Set label text.
@@ -88,9 +109,29 @@ class NaturalNumberEntry(ttk.Frame):
         self._traces.append(callback)
 
     def run_traces(self, *_) -> None:
-        """Send entry value (or repeat previous value if '') to observers. """
+        """Parse new entry text, notify observers (once typing pauses if
+           debounced).
+        """
+        text = self.entry_var.get()
+        self._value = None if text == '' else int(text)  # once per write
         if self.disabled:
             return
+        if self.debounce_ms is None:
+            self._notify()
+            return
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.debounce_ms, self.flush_traces)
+
+    def flush_traces(self) -> None:
+        """Deliver the scheduled notification now (if any). """
+        if self._pending is None:
+            return
+        self._pending = None
+        self._notify()
+
+    def _notify(self) -> None:
+        """Send entry value (or repeat previous value if '') to observers. """
         val_to_send = self.value
         if val_to_send is None:
             val_to_send = self._backup_value
@@ -104,23 +145,42 @@ class NaturalNumberEntry(ttk.Frame):
         self.disabled = False
 
     def disable_traces(self) -> None:
-        """Turn off pub-sub traces. """
+        """Turn off pub-sub traces (after delivering any pending change). """
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self.flush_traces()
         self.disabled = True
 
+    def destroy(self) -> None:
+        """Cancel any pending notification and destroy widget. """
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        super().destroy()
+
     @property
     def value(self) -> int:
         """int: current entry value (None if '') """
-        value = self.entry_var.get()
-        value = None if value == '' else int(value)
-        return value
+        return self._value
 
 
 class NaturalNumberEntries(ttk.Frame):
     """Multiple NaturalNumberEntry instances in one widget. """
-    def __init__(self, *args, **kwargs) -> None:
+    def __init__(self, *args, debounce_ms: int = 150, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self._entries: Dict[str, NaturalNumberEntry] = {}
 
+        # observers are notified here, once per burst of edits to any entry
+        # (entries notify on every write, the writes are coalesced below)
+        self.disabled = False
+        self.debounce_ms = debounce_ms
+        self._traces: List[Callable] = []
+        self._pending = None  # Tk after() id of the scheduled notification
+
+        # last-applied entry state/color, repeat calls skip the Tcl config
+        self._state = 'normal'
+        self._color = None
+
     def add_entry(self, label: str, entry: str = None):
         """Add a new labelled-entry widget to this one.
 
@@ -128,8 +188,15 @@ class NaturalNumberEntries(ttk.Frame):
             label (str): label text
             entry (str): initial entry value
         """
-        self._entries[label] = NaturalNumberEntry(self)
+        self._entries[label] = NaturalNumberEntry(self, debounce_ms=None)
         self._entries[label].set_text(label)
+        self._entries[label].add_trace(self._on_change)
+        if self.disabled:
+            self._entries[label].disable_traces()
+        if self._state != 'normal':
+            self._entries[label].entry.config(state=self._state)
+        if self._color is not None:
+            self._entries[label].set_entry_color(self._color)
         if entry is not None:
             self._entries[label].set_entry(entry)
         self._entries[label].pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
@@ -142,6 +209,17 @@ class NaturalNumberEntries(ttk.Frame):
         """
         return {label: entry.value for label, entry in self._entries.items()}
 
+    def value(self, label: str) -> int:
+        """Get one entry's value.
+
+        Args:
+            label (str): entry label
+
+        Returns:
+            int: entry value (None if '')
+        """
+        return self._entries[label].value
+
     def load(self, data: Dict[str, str]) -> None:
         """Load entry text into entry widgets.
 
@@ -151,20 +229,55 @@ class NaturalNumberEntries(ttk.Frame):
         for label, value in data.items():
             self._entries[label].set_entry(str(value))
 
+    def load_bulk(self, data: Dict[str, str]) -> None:
+        """Load entry text into entry widgets w/one Tcl evaluation.
+           Invalid text is skipped (like in load).
+
+        Args:
+            data (Dict[str, str]): map from entry label to new entry text
+        """
+        commands = []
+        for label, value in data.items():
+            entry = self._entries[label]
+            value = str(value)
+            if entry.is_valid(value):  # digits only, safe to inline
+                commands.append(f'set ::{entry.entry_var} {{{value}}}')
+        if commands:
+            self.tk.eval('; '.join(commands))
+
     def clear(self) -> None:
         """Clear entry text in every entry widget. """
-        for entry in self._entries.values():
-            entry.entry.delete(0, tk.END)
+        self._eval_each('delete 0 end')
 
     def enable(self) -> None:
         """Enable user input. """
-        for entry in self._entries.values():
-            entry.entry.config(state='normal')
+        self._set_state('normal')
 
     def disable(self) -> None:
         """Disable user input. """
-        for entry in self._entries.values():
-            entry.entry.config(state='disabled')
+        self._set_state('disabled')
+
+    def _eval_each(self, command: str) -> None:
+        """Run a Tk entry widget command on every entry w/one Tcl evaluation.
+
+        Args:
+            command (str): widget command, e.g. 'delete 0 end'
+        """
+        if self._entries:
+            self.tk.eval('; '.join(
+                f'{entry.entry} {command}' for entry in self._entries.values()
+            ))
+
+    def _set_state(self, state: str) -> None:
+        """Set every entry's state (no-op if already in that state).
+
+        Args:
+            state (str): new entry state
+        """
+        if state == self._state:
+            return
+        self._state = state
+        self._eval_each(f'configure -state {state}')
 
     def set_entry_color(self, color: str) -> None:
         """Set entry text color.
@@ -172,27 +285,55 @@ class NaturalNumberEntries(ttk.Frame):
         Args:
             color (str): new entry text color
         """
-        for entry in self._entries.values():
-            entry.set_entry_color(color)
+        if color == self._color:
+            return
+        self._color = color
+        self._eval_each(f'configure -foreground {{{color}}}')
 
     def add_trace(self, callback: Callable) -> None:
-        """Add a new observer trace to notify when entry changes.
+        """Add a new observer trace to notify when entries change.
 
         Args:
-            callback (Callable): function that accepts an int
+            callback (Callable): function that takes no arguments (read the
+                                 new values w/get or value)
         """
-        for entry in self._entries.values():
-            entry.add_trace(callback)
+        self._traces.append(callback)
+
+    def flush_traces(self) -> None:
+        """Notify observers of the pending burst of edits in one call. """
+        if self._pending is None:
+            return
+        self._pending = None
+        for callback in self._traces:
+            callback()
 
     def enable_traces(self) -> None:
         """Turn on pub-sub traces. """
         for entry in self._entries.values():
             entry.enable_traces()
+        self.disabled = False
 
     def disable_traces(self) -> None:
-        """Turn off pub-sub traces. """
+        """Turn off pub-sub traces (after delivering any pending change). """
         for entry in self._entries.values():
             entry.disable_traces()
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self.flush_traces()
+        self.disabled = True
+
+    def destroy(self) -> None:
+        """Cancel any pending notification and destroy widget. """
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+            self._pending = None
+        super().destroy()
+
+    def _on_change(self, _) -> None:
+        """(Re)schedule the notification after any entry changes. """
+        if self._pending is not None:
+            self.after_cancel(self._pending)
+        self._pending = self.after(self.debounce_ms, self.flush_traces)
 
 
 class StringToNumberEntry(ttk.Frame):
@@ -209,14 +350,12 @@ class StringToNumberEntry(ttk.Frame):
 
         # entry box and backend entry data variable
         self.value_var = tk.StringVar()
+        self.tk.eval(_VALIDATOR_PROC)  # (re)defining the proc is cheap
         tk.Entry(
             self,
             textvariable=self.value_var,
             validate='key',
-            validatecommand=(
-                self.register(self.is_valid),
-                '%P'
-            )
+            validatecommand=(_VALIDATOR, '%P')
         ).pack(padx=2, pady=2, side=tk.LEFT)
 
         # setup mechanism to update observers/subscribers
@@ -229,7 +368,8 @@ class StringToNumberEntry(ttk.Frame):
     @staticmethod
     def is_valid(proposed: str) -> bool:
         """Check whether text is a natural number (no leading zero).
-           Empty string is also okay.
+           Empty string is also okay. Mirrors the Tcl-side validator, for
+           checking text set from code (typed text is checked in Tcl).
 
         Args:
             proposed (str): text to check
@@ -237,9 +377,7 @@ class StringToNumberEntry(ttk.Frame):
         Returns:
             bool: whether text is a natural number (no leading zero)
         """
-        if proposed == '':
-            return True
-        return proposed[0] != '0' and proposed.isdigit()
+        return _NATURAL_NUMBER(proposed) is not None
 
     def set_value(self, text: str) -> bool:
         """Set value text.
@@ -303,6 +441,7 @@ class BudgetWidget(tk.Frame):
         self.donutgraph = utils.DonutGraph()
         self._data = {}
         self._colors = True
+        self._plot_pending = None  # Tk after_idle() id of scheduled replot
 
         canvas = FigureCanvasTkAgg(self.donutgraph.fig, self)
         canvas_widget = canvas.get_tk_widget()
@@ -338,7 +477,7 @@ class BudgetWidget(tk.Frame):
         if self.category.value is None:
             return
         self._data[self.category.key] = self.category.value
-        self.plot()
+        self.request_plot()
 
     def delete_category(self, category: str) -> None:
         """Delete category from budget.
@@ -346,98 +485,90 @@ class BudgetWidget(tk.Frame):
         Args:
             category (str): category to delete
         """
+        if category not in self._data:
+            return  # wedge is from before a pending replot
         del self._data[category]
+        self.request_plot()
+
+    def request_plot(self) -> None:
+        """Schedule one redraw of data for when Tk is idle (coalesces bursts
+           of adds/deletes into a single donut rebuild).
+        """
+        if self._plot_pending is None:
+            self._plot_pending = self.after_idle(self._flush_plot)
+
+    def _flush_plot(self) -> None:
+        """Run the scheduled redraw. """
+        self._plot_pending = None
         self.plot()
 
+    def destroy(self) -> None:
+        """Cancel any scheduled redraw and destroy widget. """
+        if self._plot_pending is not None:
+            self.after_cancel(self._plot_pending)
+            self._plot_pending = None
+        super().destroy()
+
     def plot(self) -> None:
         """Draw/redraw data. """
         if len(self._data) == 0:
-            self.donutgraph.axes.cla()
-            self.donutgraph.fig.canvas.draw()
+            self.donutgraph.clear()
             return
-
-        if self._colors:
-            self.donutgraph.plot(self._data)
-        else:
-            self.donutgraph.plot(
-                self._data,
-                {k: '#777' for k in self._data}
-            )
+        self.donutgraph.plot(self._data, self._color_map())
 
     def toggle_colors(self) -> None:
-        """Redraw donut after toggling color versus no color setting. """
+        """Recolor donut after toggling color versus no color setting. """
         self._colors = not self._colors
-        self.plot()
+        if self._plot_pending is not None:
+            return  # plotted wedges are outdated, pending replot recolors
+        self.donutgraph.recolor(self._color_map())
 
+    def _color_map(self) -> Optional[Dict[str, str]]:
+        """Get wedge colors for the current color setting.
+
+        Returns:
+            Optional[Dict[str, str]]: label -> color (None for default palette)
+        """
+        if self._colors:
+            return None
+        return {k: '#777' for k in self._data}
+
+
+class SelectableGraphFrame(tk.Frame):
+    """Line graph where the selected line is edited via labelled entries.
+       Subclasses configure the graph w/the class attributes below.
+    """
+    TITLE = ''                     # graph title
+    XLABEL = ''                    # graph x-axis label
+    FIELDS: Dict[str, str] = {}    # entry label -> line metadata key
+    DEFAULTS: Dict[str, int] = {}  # metadata of newly-added lines
+    FILENAME = 'graph'             # default name of downloaded images
+
+    # required: line metadata (as kwargs) -> (length, running balance)
+    calc: Callable[..., Tuple[int, np.ndarray]]
 
-class DebtPayoffWidget(tk.Frame):
-    """Widget for showing how APR and payment amount impact payoff time. """
     def __init__(self, *args, **kwargs) -> None:
         super().__init__(*args, **kwargs)
         self.linegraph = utils.LineGraph()
         self.selected = None  # index of selected line
 
         # graph annotations
-        self.linegraph.axes.set_title('Debt Payoff Schedule')
+        self.linegraph.axes.set_title(self.TITLE)
         self.linegraph.axes.grid()
-        self.linegraph.axes.set_xlabel('months')
+        self.linegraph.axes.set_xlabel(self.XLABEL)
         self.linegraph.axes.set_ylabel('balance')
 
         # register a callback to swap selected line
         canvas = FigureCanvasTkAgg(self.linegraph.fig, self)
-
-        def swap_selected(event) -> None:
-            # identify which line user clicked on
-            for i_line, line in self.linegraph:
-                if event.artist == line:
-                    break
-
-            # pylint: disable=undefined-loop-variable
-            self.entries.disable_traces()
-            self.entries.clear()
-            self.entries.disable()
-            self.entries.set_entry_color('black')
-            if self.selected is None:
-                # select line
-                self.linegraph.select(i_line)
-                self.entries.enable()
-                self.entries.load({
-                    'Balance': str(line.metadata['balance']),
-                    'Monthly Payment': str(line.metadata['payment']),
-                    'APR': str(line.metadata['apr'])
-                })
-                self.entries.enable_traces()
-                self.selected = i_line
-            elif self.selected == i_line:
-                # unselect previously-selected line
-                self.linegraph.unselect(self.selected)
-                self.selected = None
-            else:
-                # unselect previously-selected line
-                self.linegraph.unselect(self.selected)
-
-                # select line
-                self.linegraph.select(i_line)
-                self.entries.enable()
-                self.entries.load({
-                    'Balance': str(line.metadata['balance']),
-                    'Monthly Payment': str(line.metadata['payment']),
-                    'APR': str(line.metadata['apr'])
-                })
-                self.entries.enable_traces()
-                self.selected = i_line
-            # pylint: enable=undefined-loop-variable
-
-        canvas.mpl_connect('pick_event', swap_selected)
+        canvas.mpl_connect('pick_event', self._on_pick)
         canvas_widget = canvas.get_tk_widget()
         canvas_widget.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
 
         # user inputs
         self.entries = NaturalNumberEntries(self)
-        self.entries.add_entry('Balance')          # debt starting balance
-        self.entries.add_entry('Monthly Payment')  # monthly payment
-        self.entries.add_entry('APR')              # annual % rate (APR)
-        self.entries.disable()                     # b/c obv no lines to edit
+        for label in self.FIELDS:
+            self.entries.add_entry(label)
+        self.entries.disable()  # b/c obv no lines to edit
         self.entries.add_trace(self.entry_change_callback)
         self.entries.pack(padx=2, pady=2, fill=tk.X)
 
@@ -471,228 +602,126 @@ class DebtPayoffWidget(tk.Frame):
 
     def add_line(self) -> None:
         """Add a new line to the graph. """
-        _, running_balance = utils.calc_time_until_cleared(
-            balance=1000,
-            payment=25,
-            apr=25
-        )
+        _, running_balance = self.calc(**self.DEFAULTS)
         self.linegraph.plot(
             running_balance, '-', picker=5,
-            metadata={'balance': 1000, 'payment': 25, 'apr': 25}
+            metadata=self.DEFAULTS
         )
 
     def delete_line(self) -> None:
         """Delete the selected line. """
         if self.selected is None:
             return
-        self.linegraph.remove(self.selected)
-        self.selected = None
-        self.entries.clear()
-        self.entries.disable()
+        selected = self.selected
+        with self.linegraph.batch():
+            self._apply_selection(None)
+            self.linegraph.remove(selected)
 
     def download_image(self) -> None:
         """Save the current figure to disk. """
         filepath = filedialog.asksaveasfilename(
-            defaultextension='.jpg',
-            filetypes=[('JPEG files', '*.jpg;*.jpeg'), ('PNG files', '*.png')],
-            initialfile='debtpayoff'
+            defaultextension=_DEFAULT_EXT,
+            filetypes=_FILETYPES,
+            initialfile=self.FILENAME
         )  # ask the user where to save the file
         if filepath:
             self.linegraph.fig.savefig(filepath)  # Save the plot to the file
 
-    def entry_change_callback(self, _) -> None:
+    def entry_change_callback(self) -> None:
         """Update currently-selected line. """
-        meta = self.entries.get()
+        if self.selected is None:
+            return
         meta = {
-            'balance': meta['Balance'],
-            'payment': meta['Monthly Payment'],
-            'apr': meta['APR']
+            key: self.entries.value(label)
+            for label, key in self.FIELDS.items()
         }
+        if None in meta.values():
+            self.entries.set_entry_color('red')  # some entries are empty
+            return
+        if meta == self.linegraph.lines[self.selected].metadata:
+            self.entries.set_entry_color('black')  # line already shows this
+            return
 
         try:
-            self.entries.set_entry_color('red')
-            _, running_bal = utils.calc_time_until_cleared(**meta)
+            _, running_bal = self.calc(**meta)
         except RuntimeError:
-            pass  # intermediate entry values where interest > payment
-        except TypeError:
-            pass  # balance, payment, or APR have None values
+            # intermediate entry values the calculation rejects
+            self.entries.set_entry_color('red')
         else:
-            self.linegraph.update(
-                self.selected,
-                range(len(running_bal)),
-                running_bal,
-                metadata=meta
-            )
+            self.linegraph.update(self.selected, running_bal, metadata=meta)
             self.entries.set_entry_color('black')
 
+    def _on_pick(self, event) -> None:
+        """Swap selected line to the one user clicked on. """
+        i_line = self.linegraph.index(event.artist)
+        if i_line is None:
+            return
+        if i_line == self.selected:
+            i_line = None  # clicking selected line unselects it
+        self._apply_selection(i_line)
 
-class FireWidget(tk.Frame):
-    """Widget that shows time until a portfolio generates a goal income. """
-    def __init__(self, *args, **kwargs) -> None:
-        super().__init__(*args, **kwargs)
-        self.linegraph = utils.LineGraph()
-        self.selected = None  # index of selected line
-
-        # graph annotations
-        self.linegraph.axes.set_title('How Long Until Money Printer Go Brr')
-        self.linegraph.axes.grid()
-        self.linegraph.axes.set_xlabel('year')
-        self.linegraph.axes.set_ylabel('balance')
-
-        # register a callback to swap selected line
-        canvas = FigureCanvasTkAgg(self.linegraph.fig, self)
+    def _apply_selection(self, i_line: Optional[int]) -> None:
+        """Select a line (or none) and show its metadata in the entries.
 
-        def swap_selected(event) -> None:
-            # identify which line user clicked on
-            for i_line, line in self.linegraph:
-                if event.artist == line:
-                    break
+        Args:
+            i_line (Optional[int]): index of line to select (None to unselect)
+        """
+        # deliver pending edits to the old selection before swapping
+        self.entries.disable_traces()
 
-            # pylint: disable=undefined-loop-variable
-            self.entries.set_entry_color('black')
-            self.entries.disable_traces()
-            self.entries.clear()
-            self.entries.disable()
-            if self.selected is None:
-                # select line
-                self.linegraph.select(i_line)
-                self.entries.enable()
-                self.entries.load({
-                    'Target Income': str(line.metadata['income']),
-                    'Starting Portfolio Value': str(line.metadata['balance']),
-                    'Monthly Deposit': str(line.metadata['deposit']),
-                    'Growth Rate': str(line.metadata['rate']),
-                    'Safe Rate': str(line.metadata['safe_rate'])
-                })
-                self.entries.enable_traces()
-                self.selected = i_line
-            elif self.selected == i_line:
-                # unselect previously-selected line
+        # restyle both lines back-to-back w/one redraw
+        with self.linegraph.batch():
+            if self.selected is not None:
                 self.linegraph.unselect(self.selected)
-                self.selected = None
-            else:
-                # unselect previously-selected line
-                self.linegraph.unselect(self.selected)
-
-                # select line
+            if i_line is not None:
                 self.linegraph.select(i_line)
-                self.entries.enable()
-                self.entries.load({
-                    'Target Income': str(line.metadata['income']),
-                    'Starting Portfolio Value': str(line.metadata['balance']),
-                    'Monthly Deposit': str(line.metadata['deposit']),
-                    'Growth Rate': str(line.metadata['rate']),
-                    'Safe Rate': str(line.metadata['safe_rate'])
-                })
-                self.entries.enable_traces()
-                self.selected = i_line
-            # pylint: enable=undefined-loop-variable
-
-        canvas.mpl_connect('pick_event', swap_selected)
-        canvas_widget = canvas.get_tk_widget()
-        canvas_widget.pack(expand=True, fill=tk.BOTH, padx=2, pady=2)
-
-        # user inputs
-        self.entries = NaturalNumberEntries(self)
-        self.entries.add_entry('Target Income')
-        self.entries.add_entry('Starting Portfolio Value')
-        self.entries.add_entry('Monthly Deposit')
-        self.entries.add_entry('Growth Rate')
-        self.entries.add_entry('Safe Rate')
-        self.entries.disable()  # b/c obv no lines to edit
-        self.entries.add_trace(self.entry_change_callback)
-        self.entries.pack(padx=2, pady=2, fill=tk.X)
-
-        # add button
-        self.add_button = ttk.Button(
-            self,
-            text='New line',
-            command=self.add_line
-        )
-        self.add_button.pack(padx=2, pady=2, fill=tk.X)
-
-        # delete button
-        self.del_button = ttk.Button(
-            self,
-            text='Delete',
-            command=self.delete_line
-        )
-        self.del_button.pack(padx=2, pady=2, fill=tk.X)
-
-        # save button
-        self.save_button = ttk.Button(
-            self,
-            text='Download image',
-            command=self.download_image
-        )
-        self.save_button.pack(padx=2, pady=2, fill=tk.X)
-
-        # hotkeys (assume master == root)
-        self.master.bind('<Control-s>', lambda _: self.download_image())
-        canvas_widget.bind('<BackSpace>', lambda _: self.delete_line())
-
-    def add_line(self) -> None:
-        """Add a new line to the graph. """
-        _, running_balance = utils.calc_time_until_fire(
-            income=3000,
-            balance=1000,
-            deposit=100,
-            rate=7,
-            safe_rate=5
-        )
-        self.linegraph.plot(
-            running_balance, '-', picker=5,
-            metadata={
-                'income': 3000,
-                'balance': 1000,
-                'deposit': 100,
-                'rate': 7,
-                'safe_rate': 5
-            }
-        )
+        self.selected = i_line
 
-    def delete_line(self) -> None:
-        """Delete the selected line. """
-        if self.selected is None:
+        # then update entries in one pass
+        self.entries.set_entry_color('black')
+        if i_line is None:
+            self.entries.clear()
+            self.entries.disable()
             return
-        self.linegraph.remove(self.selected)
-        self.selected = None
-        self.entries.clear()
-        self.entries.disable()
-
-    def download_image(self) -> None:
-        """Save the current figure to disk. """
-        filepath = filedialog.asksaveasfilename(
-            defaultextension='.jpg',
-            filetypes=[('JPEG files', '*.jpg;*.jpeg'), ('PNG files', '*.png')],
-            initialfile='debtpayoff'
-        )  # ask the user where to save the file
-        if filepath:
-            self.linegraph.fig.savefig(filepath)  # Save the plot to the file
+        self.entries.enable()
+        metadata = self.linegraph.lines[i_line].metadata
+        self.entries.load_bulk({  # overwrites every entry, no need to clear
+            label: str(metadata[key]) for label, key in self.FIELDS.items()
+        })
+        self.entries.enable_traces()
 
-    def entry_change_callback(self, _) -> None:
-        """Update currently-selected line. """
-        meta = self.entries.get()
-        meta = {
-            'income': meta['Target Income'],
-            'balance': meta['Starting Portfolio Value'],
-            'deposit': meta['Monthly Deposit'],
-            'rate': meta['Growth Rate'],
-            'safe_rate': meta['Safe Rate']
-        }
 
-        try:
-            self.entries.set_entry_color('red')
-            _, running_bal = utils.calc_time_until_fire(**meta)
-        except RuntimeError:
-            pass  # intermediate entry values where interest > payment
-        except TypeError:
-            pass  # balance, payment, or APR have None values
-        else:
-            self.linegraph.update(
-                self.selected,
-                range(len(running_bal)),
-                running_bal,
-                metadata=meta
-            )
-            self.entries.set_entry_color('black')
+class DebtPayoffWidget(SelectableGraphFrame):
+    """Widget for showing how APR and payment amount impact payoff time. """
+    TITLE = 'Debt Payoff Schedule'
+    XLABEL = 'months'
+    FIELDS = {
+        'Balance': 'balance',          # debt starting balance
+        'Monthly Payment': 'payment',  # monthly payment
+        'APR': 'apr'                   # annual % rate (APR)
+    }
+    DEFAULTS = {'balance': 1000, 'payment': 25, 'apr': 25}
+    FILENAME = 'debtpayoff'
+    calc = staticmethod(utils.calc_time_until_cleared)
+
+
+class FireWidget(SelectableGraphFrame):
+    """Widget that shows time until a portfolio generates a goal income. """
+    TITLE = 'How Long Until Money Printer Go Brr'
+    XLABEL = 'year'
+    FIELDS = {
+        'Target Income': 'income',
+        'Starting Portfolio Value': 'balance',
+        'Monthly Deposit': 'deposit',
+        'Growth Rate': 'rate',
+        'Safe Rate': 'safe_rate'
+    }
+    DEFAULTS = {
+        'income': 3000,
+        'balance': 1000,
+        'deposit': 100,
+        'rate': 7,
+        'safe_rate': 5
+    }
+    FILENAME = 'fire'
+    calc = staticmethod(utils.calc_time_until_fire)